@@ -17,7 +17,10 @@ import plotly.graph_objects as go
 import plotly.express as px
 import requests
 import time
-from typing import Dict, Any, Optional, Tuple
+import os
+from typing import Dict, Any, List, Optional, Tuple
+
+from simulation import simulate_calendar_pnl, DEFAULT_PATHS, PERCENTILES
 
 
 # Configuration for API keys
@@ -27,6 +30,13 @@ API_KEYS = {
     'iex': st.secrets.get("IEX_API_KEY", "") if hasattr(st, 'secrets') else "",
 }
 
+# Watchlist monitor limits, to avoid saturating data providers
+WATCHLIST_MAX_SYMBOLS = 50
+WATCHLIST_MAX_CHAIN_REFRESHES = 5  # Per poll
+WATCHLIST_CHAIN_MAX_AGE = timedelta(minutes=30)
+WATCHLIST_MAX_QUOTE_FALLBACKS = 5  # Per poll
+WATCHLIST_RETRY_BACKOFF = timedelta(minutes=15)
+
 
 def filter_dates(dates):
     today = datetime.today().date()
@@ -336,6 +346,199 @@ def create_mock_options_data(ticker_symbol: str, current_price: float) -> Dict[s
     }
 
 
+@st.cache_data(ttl=86400)  # Earnings history changes at most once a quarter
+def get_historical_earnings_gaps(ticker_symbol: str, limit: int = 24) -> Optional[np.ndarray]:
+    """Get close-to-close moves on past earnings reaction days using yfinance"""
+    try:
+        stock = yf.Ticker(ticker_symbol)
+        earnings_dates = stock.get_earnings_dates(limit=limit)
+        if earnings_dates is None or earnings_dates.empty:
+            return None
+
+        history = stock.history(period='10y')
+        if history.empty:
+            return None
+        closes = history['Close'].copy()
+        closes.index = closes.index.tz_localize(None).normalize()
+        session_days = closes.index
+
+        gaps = []
+        for event_time in earnings_dates.index:
+            event_time = event_time.tz_localize(None)
+            # Reports after midday trade on the following session
+            event_day = event_time.normalize()
+            pos = session_days.searchsorted(event_day, side='right' if event_time.hour >= 12 else 'left')
+            if pos <= 0 or pos >= len(session_days):
+                continue
+            gaps.append(closes.iloc[pos] / closes.iloc[pos - 1] - 1.0)
+
+        if gaps:
+            return np.array(gaps)
+    except Exception as e:
+        st.warning(f"Earnings history unavailable: {str(e)}")
+    return None
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def run_calendar_simulation(ticker_symbol: str, underlying_price: float, dtes: Tuple[int, ...],
+                            ivs: Tuple[float, ...], rv30: float, expected_move: Optional[float],
+                            n_paths: int, workers: int) -> Dict[str, Any]:
+    """Run the Monte Carlo calendar P&L simulation for an analyzed ticker"""
+    try:
+        historical_gaps = get_historical_earnings_gaps(ticker_symbol)
+        return simulate_calendar_pnl(
+            underlying_price,
+            list(dtes),
+            list(ivs),
+            rv30,
+            expected_move=expected_move,
+            historical_gaps=historical_gaps,
+            n_paths=n_paths,
+            workers=workers,
+        )
+    except Exception as e:
+        return {"error": f"Simulation failed: {str(e)}"}
+
+
+def get_options_data(ticker_symbol: str, underlying_price: float) -> Dict[str, Any]:
+    """Get the ATM term structure and front-month straddle, falling back to estimates"""
+    # Try to get options data (yfinance only for now)
+    options_chains = {}
+    
+    try:
+        stock = yf.Ticker(ticker_symbol)
+        if len(stock.options) > 0:
+            exp_dates = list(stock.options)
+            exp_dates = filter_dates(exp_dates)
+            
+            for exp_date in exp_dates:
+                options_chains[exp_date] = stock.option_chain(exp_date)
+    except Exception as e:
+        st.warning(f"Options data unavailable: {str(e)}")
+        options_chains = {}
+    
+    atm_iv = {}
+    straddle = None
+    
+    for i, (exp_date, chain) in enumerate(options_chains.items()):
+        calls = chain.calls
+        puts = chain.puts
+
+        if calls.empty or puts.empty:
+            continue
+
+        call_diffs = (calls['strike'] - underlying_price).abs()
+        call_idx = call_diffs.idxmin()
+        call_iv = calls.loc[call_idx, 'impliedVolatility']
+
+        put_diffs = (puts['strike'] - underlying_price).abs()
+        put_idx = put_diffs.idxmin()
+        put_iv = puts.loc[put_idx, 'impliedVolatility']
+
+        atm_iv_value = (call_iv + put_iv) / 2.0
+        atm_iv[exp_date] = atm_iv_value
+
+        if i == 0:
+            call_bid = calls.loc[call_idx, 'bid']
+            call_ask = calls.loc[call_idx, 'ask']
+            put_bid = puts.loc[put_idx, 'bid']
+            put_ask = puts.loc[put_idx, 'ask']
+            
+            if (call_bid is not None and call_ask is not None and 
+                put_bid is not None and put_ask is not None):
+                call_mid = (call_bid + call_ask) / 2.0
+                put_mid = (put_bid + put_ask) / 2.0
+                straddle = call_mid + put_mid
+    
+    if not atm_iv:
+        # Fallback to mock data
+        mock_data = create_mock_options_data(ticker_symbol, underlying_price)
+        return {
+            'dtes': mock_data['dtes'],
+            'ivs': mock_data['ivs'],
+            'straddle': mock_data['straddle'],
+            'expected_move': round(mock_data['straddle'] / underlying_price * 100, 2),
+            'options_source': "Estimated (Options unavailable)"
+        }
+    
+    # Process real options data
+    today = datetime.today().date()
+    dtes = []
+    ivs = []
+    for exp_date, iv in atm_iv.items():
+        exp_date_obj = datetime.strptime(exp_date, "%Y-%m-%d").date()
+        days_to_expiry = (exp_date_obj - today).days
+        dtes.append(days_to_expiry)
+        ivs.append(iv)
+    
+    return {
+        'dtes': dtes,
+        'ivs': ivs,
+        'straddle': straddle,
+        # Priced against the quote the chain was fetched at, so it stays consistent with the straddle
+        'expected_move': round(straddle / underlying_price * 100, 2) if straddle else None,
+        'options_source': "Real Options Data"
+    }
+
+
+def compute_term_structure_metrics(dtes, ivs) -> Dict[str, float]:
+    """Compute the term structure slope and IV30 from the ATM term structure"""
+    term_spline = build_term_structure(dtes, ivs)
+    return {
+        'ts_slope_0_45': (term_spline(45) - term_spline(dtes[0])) / (45 - dtes[0]),
+        'iv30': term_spline(30)
+    }
+
+
+def compute_history_metrics(price_history: pd.DataFrame) -> Dict[str, float]:
+    """Compute realized volatility and average volume from daily price history"""
+    return {
+        'rv30': yang_zhang(price_history),
+        'avg_volume': price_history['Volume'].rolling(30).mean().dropna().iloc[-1]
+    }
+
+
+def build_recommendation(ticker_symbol: str, underlying_price: float, options_data: Dict[str, Any],
+                         term_metrics: Dict[str, float], history_metrics: Dict[str, float]) -> Dict[str, Any]:
+    """Combine options, term structure and history metrics into the criteria checks"""
+    avg_volume = history_metrics['avg_volume']
+    rv30 = history_metrics['rv30']
+    iv30_rv30 = term_metrics['iv30'] / rv30
+    ts_slope_0_45 = term_metrics['ts_slope_0_45']
+    expected_move = options_data['expected_move']
+
+    return {
+        'success': True,
+        'ticker': ticker_symbol,
+        'underlying_price': underlying_price,
+        'options_source': options_data['options_source'],
+        'avg_volume': avg_volume,
+        'avg_volume_pass': avg_volume >= 1500000,
+        'iv30_rv30': iv30_rv30,
+        'iv30_rv30_pass': iv30_rv30 >= 1.25,
+        'ts_slope_0_45': ts_slope_0_45,
+        'ts_slope_pass': ts_slope_0_45 <= -0.00406,
+        'expected_move': expected_move,
+        'dtes': options_data['dtes'],
+        'ivs': options_data['ivs'],
+        'rv30': rv30
+    }
+
+
+def get_recommendation_status(result: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Classify a result as RECOMMENDED/CONSIDER/AVOID, with its display color and icon"""
+    avg_volume_pass = result['avg_volume_pass']
+    iv30_rv30_pass = result['iv30_rv30_pass']
+    ts_slope_pass = result['ts_slope_pass']
+    
+    if avg_volume_pass and iv30_rv30_pass and ts_slope_pass:
+        return "RECOMMENDED", "success", "✅"
+    elif ts_slope_pass and ((avg_volume_pass and not iv30_rv30_pass) or (iv30_rv30_pass and not avg_volume_pass)):
+        return "CONSIDER", "warning", "⚠️"
+    else:
+        return "AVOID", "error", "❌"
+
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def compute_recommendation(ticker_symbol: str):
     try:
@@ -348,121 +551,27 @@ def compute_recommendation(ticker_symbol: str):
         if underlying_price is None:
             return {"error": "Unable to retrieve current stock price from any source."}
         
-        # Try to get options data (yfinance only for now)
-        options_data = None
-        options_available = False
-        
-        try:
-            stock = yf.Ticker(ticker_symbol)
-            if len(stock.options) > 0:
-                exp_dates = list(stock.options)
-                exp_dates = filter_dates(exp_dates)
-                options_available = True
-                
-                options_chains = {}
-                for exp_date in exp_dates:
-                    options_chains[exp_date] = stock.option_chain(exp_date)
-        except Exception as e:
-            st.warning(f"Options data unavailable: {str(e)}")
-            options_available = False
-        
         # Get price history with fallbacks
         price_history, history_source = get_price_history_fallback(ticker_symbol)
         if price_history is None:
             return {"error": "Unable to retrieve price history from any source."}
         
         # Process options data or use mock data
-        if options_available:
-            atm_iv = {}
-            straddle = None
-            
-            for i, (exp_date, chain) in enumerate(options_chains.items()):
-                calls = chain.calls
-                puts = chain.puts
-
-                if calls.empty or puts.empty:
-                    continue
-
-                call_diffs = (calls['strike'] - underlying_price).abs()
-                call_idx = call_diffs.idxmin()
-                call_iv = calls.loc[call_idx, 'impliedVolatility']
-
-                put_diffs = (puts['strike'] - underlying_price).abs()
-                put_idx = put_diffs.idxmin()
-                put_iv = puts.loc[put_idx, 'impliedVolatility']
-
-                atm_iv_value = (call_iv + put_iv) / 2.0
-                atm_iv[exp_date] = atm_iv_value
-
-                if i == 0:
-                    call_bid = calls.loc[call_idx, 'bid']
-                    call_ask = calls.loc[call_idx, 'ask']
-                    put_bid = puts.loc[put_idx, 'bid']
-                    put_ask = puts.loc[put_idx, 'ask']
-                    
-                    if (call_bid is not None and call_ask is not None and 
-                        put_bid is not None and put_ask is not None):
-                        call_mid = (call_bid + call_ask) / 2.0
-                        put_mid = (put_bid + put_ask) / 2.0
-                        straddle = call_mid + put_mid
-            
-            if not atm_iv:
-                # Fallback to mock data
-                mock_data = create_mock_options_data(ticker_symbol, underlying_price)
-                dtes = mock_data['dtes']
-                ivs = mock_data['ivs']
-                straddle = mock_data['straddle']
-                data_source = "Estimated (Options unavailable)"
-            else:
-                # Process real options data
-                today = datetime.today().date()
-                dtes = []
-                ivs = []
-                for exp_date, iv in atm_iv.items():
-                    exp_date_obj = datetime.strptime(exp_date, "%Y-%m-%d").date()
-                    days_to_expiry = (exp_date_obj - today).days
-                    dtes.append(days_to_expiry)
-                    ivs.append(iv)
-                data_source = "Real Options Data"
-        else:
-            # Use mock data
-            mock_data = create_mock_options_data(ticker_symbol, underlying_price)
-            dtes = mock_data['dtes']
-            ivs = mock_data['ivs']
-            straddle = mock_data['straddle']
-            data_source = "Estimated (Options unavailable)"
-        
-        # Build term structure
-        term_spline = build_term_structure(dtes, ivs)
-        ts_slope_0_45 = (term_spline(45) - term_spline(dtes[0])) / (45 - dtes[0])
+        options_data = get_options_data(ticker_symbol, underlying_price)
         
-        # Calculate volatility metrics
-        rv30 = yang_zhang(price_history)
-        iv30_rv30 = term_spline(30) / rv30
-
-        # Calculate volume metrics
-        avg_volume = price_history['Volume'].rolling(30).mean().dropna().iloc[-1]
-        expected_move = round(straddle / underlying_price * 100, 2) if straddle else None
-
-        return {
-            'success': True,
-            'ticker': ticker_symbol,
-            'underlying_price': underlying_price,
+        result = build_recommendation(
+            ticker_symbol,
+            underlying_price,
+            options_data,
+            compute_term_structure_metrics(options_data['dtes'], options_data['ivs']),
+            compute_history_metrics(price_history)
+        )
+        result.update({
             'price_source': price_source,
             'history_source': history_source,
-            'options_source': data_source,
-            'avg_volume': avg_volume,
-            'avg_volume_pass': avg_volume >= 1500000,
-            'iv30_rv30': iv30_rv30,
-            'iv30_rv30_pass': iv30_rv30 >= 1.25,
-            'ts_slope_0_45': ts_slope_0_45,
-            'ts_slope_pass': ts_slope_0_45 <= -0.00406,
-            'expected_move': expected_move,
-            'dtes': dtes,
-            'ivs': ivs,
-            'rv30': rv30,
             'price_history': price_history
-        }
+        })
+        return result
         
     except Exception as e:
         return {"error": f"Error occurred processing: {str(e)}"}
@@ -516,6 +625,331 @@ def create_price_chart(price_history):
     return fig
 
 
+def create_pnl_histogram(pnl_pct):
+    """Create a histogram of simulated calendar P&L as a percent of debit"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Histogram(
+        x=pnl_pct,
+        nbinsx=80,
+        name="Simulated P&L",
+        marker=dict(color='steelblue')
+    ))
+    
+    fig.add_vline(x=0, line_dash="dash", line_color="red")
+    
+    fig.update_layout(
+        title="Simulated Calendar P&L Distribution",
+        xaxis_title="P&L (% of Debit)",
+        yaxis_title="Paths",
+        height=400,
+        showlegend=False
+    )
+    
+    return fig
+
+
+def get_current_prices_batch(ticker_symbols: List[str]) -> Dict[str, float]:
+    """Get current prices for a list of symbols in a single yfinance request"""
+    prices = {}
+    try:
+        data = yf.download(ticker_symbols, period='1d', interval='1m', progress=False, auto_adjust=False)
+        if not data.empty:
+            closes = data['Close']
+            if isinstance(closes, pd.Series):
+                closes = closes.to_frame(ticker_symbols[0])
+            last_closes = closes.ffill().iloc[-1]
+            for ticker_symbol in ticker_symbols:
+                if ticker_symbol in last_closes and pd.notna(last_closes[ticker_symbol]):
+                    prices[ticker_symbol] = float(last_closes[ticker_symbol])
+    except Exception as e:
+        st.warning(f"YFinance batch quote failed: {str(e)}")
+    return prices
+
+
+def has_watchlist_chain(entry: Dict[str, Any]) -> bool:
+    """Check that a watchlist entry holds a complete options chain snapshot"""
+    return all(key in entry for key in ('options_data', 'term_metrics', 'chain_price', 'chain_time'))
+
+
+def update_watchlist_entry(entry: Dict[str, Any], ticker_symbol: str, underlying_price: float,
+                           refresh_chain: bool) -> bool:
+    """
+    Recompute only the stale parts of a watchlist symbol.
+
+    Price history is refetched once per day and the options chain only when
+    `refresh_chain` is set; everything else is rebuilt from the stored
+    metrics. Returns True when the symbol's status or displayed metrics changed.
+    """
+    today = datetime.today().date()
+    
+    if entry.get('history_date') != today:
+        price_history, history_source = get_price_history_fallback(ticker_symbol)
+        if price_history is None:
+            entry['error'] = "Unable to retrieve price history from any source."
+            return False
+        entry['price_history'] = price_history
+        entry['history_source'] = history_source
+        entry['history_metrics'] = compute_history_metrics(price_history)
+        entry['history_date'] = today
+    
+    if refresh_chain:
+        # Compute before storing so a failure never leaves a partial chain on the entry
+        options_data = get_options_data(ticker_symbol, underlying_price)
+        if options_data['options_source'] != "Real Options Data":
+            # Never rate a symbol on estimated values; keep the previous snapshot and retry later
+            entry['error'] = "Options data unavailable; keeping the last real chain."
+            return False
+        term_metrics = compute_term_structure_metrics(options_data['dtes'], options_data['ivs'])
+        entry.update({
+            'options_data': options_data,
+            'term_metrics': term_metrics,
+            'chain_price': underlying_price,
+            'chain_time': datetime.now()
+        })
+    
+    result = build_recommendation(
+        ticker_symbol,
+        underlying_price,
+        entry['options_data'],
+        entry['term_metrics'],
+        entry['history_metrics']
+    )
+    status = get_recommendation_status(result)[0]
+    signature = (
+        status,
+        round(result['avg_volume'], -3),
+        round(result['iv30_rv30'], 3),
+        round(result['ts_slope_0_45'], 6),
+        result['expected_move']
+    )
+    
+    entry.pop('error', None)
+    entry['result'] = result
+    entry['previous_status'] = entry.get('status')
+    entry['status'] = status
+    
+    if signature == entry.get('signature'):
+        return False
+    entry['signature'] = signature
+    entry['version'] = entry.get('version', 0) + 1
+    entry['changed_at'] = datetime.now()
+    return True
+
+
+def poll_watchlist(watchlist: Dict[str, Dict[str, Any]], ticker_symbols: List[str],
+                   move_threshold: float) -> Dict[str, Any]:
+    """Poll quotes for the watchlist and refresh chains only where the price moved past the threshold"""
+    now = datetime.now()
+    prices = get_current_prices_batch(ticker_symbols)
+    
+    # An empty batch usually means Yahoo is rate limiting, so skip this poll
+    # rather than falling back to every provider for every symbol
+    if not prices:
+        return {
+            'polled_at': now,
+            'skipped': True,
+            'quoted': 0,
+            'chains_refreshed': [],
+            'changed': [],
+            'status_changes': [],
+            'deferred': 0
+        }
+    
+    # Rotate fallback quotes through the missing symbols, least recently tried first,
+    # and back off symbols no provider can quote
+    missing = [
+        s for s in ticker_symbols
+        if s not in prices and now >= watchlist.setdefault(s, {}).get('quote_retry_at', now)
+    ]
+    missing.sort(key=lambda s: watchlist[s].get('quote_attempt_at', datetime.min))
+    for ticker_symbol in missing[:WATCHLIST_MAX_QUOTE_FALLBACKS]:
+        entry = watchlist[ticker_symbol]
+        entry['quote_attempt_at'] = now
+        price, _ = get_current_price_fallback(ticker_symbol)
+        if price is None:
+            entry['quote_error'] = "Unable to retrieve current stock price from any source."
+            entry['quote_retry_at'] = now + WATCHLIST_RETRY_BACKOFF
+        else:
+            prices[ticker_symbol] = price
+    
+    # Rank chain refreshes by how far the price has drifted since the last fetch
+    chain_moves = {}
+    for ticker_symbol, price in prices.items():
+        entry = watchlist.setdefault(ticker_symbol, {})
+        entry.pop('quote_error', None)
+        entry.pop('quote_retry_at', None)
+        if entry.get('retry_at') and now < entry['retry_at']:
+            continue
+        if not has_watchlist_chain(entry):
+            chain_moves[ticker_symbol] = float('inf')
+            continue
+        move = abs(price / entry['chain_price'] - 1.0)
+        if move >= move_threshold or now - entry['chain_time'] >= WATCHLIST_CHAIN_MAX_AGE:
+            chain_moves[ticker_symbol] = move
+    
+    refresh = sorted(chain_moves, key=chain_moves.get, reverse=True)[:WATCHLIST_MAX_CHAIN_REFRESHES]
+    
+    changed = []
+    status_changes = []
+    for ticker_symbol, price in prices.items():
+        entry = watchlist[ticker_symbol]
+        if entry.get('retry_at') and now < entry['retry_at']:
+            continue
+        if not has_watchlist_chain(entry) and ticker_symbol not in refresh:
+            continue
+        if price == entry.get('price') and ticker_symbol not in refresh:
+            continue
+        
+        entry['price'] = price
+        try:
+            if update_watchlist_entry(entry, ticker_symbol, price, ticker_symbol in refresh):
+                changed.append(ticker_symbol)
+                if entry['previous_status'] and entry['previous_status'] != entry['status']:
+                    status_changes.append((ticker_symbol, entry['previous_status'], entry['status']))
+        except Exception as e:
+            entry['error'] = f"Error occurred processing: {str(e)}"
+        
+        # Back off failing symbols so they don't retry (and take a refresh slot) every poll
+        entry['retry_at'] = now + WATCHLIST_RETRY_BACKOFF if 'error' in entry else None
+    
+    return {
+        'polled_at': now,
+        'skipped': False,
+        'quoted': len(prices),
+        'chains_refreshed': refresh,
+        'changed': changed,
+        'status_changes': status_changes,
+        'deferred': len(chain_moves) - len(refresh)
+    }
+
+
+def render_watchlist_monitor(ticker_symbols: List[str], move_threshold: float, running: bool,
+                             poll_interval: int):
+    """Poll (when running and due) and render the watchlist table and charts for the selected symbol"""
+    watchlist = st.session_state.setdefault('watchlist', {})
+    for ticker_symbol in list(watchlist):
+        if ticker_symbol not in ticker_symbols:
+            del watchlist[ticker_symbol]
+    
+    # Widget interactions also rerun the fragment, so only poll once the interval has elapsed.
+    # The one-second slack keeps timer jitter from skipping a scheduled poll.
+    last_poll = st.session_state.get('watchlist_poll')
+    poll_due = last_poll is None or datetime.now() - last_poll['polled_at'] >= timedelta(seconds=poll_interval - 1)
+    
+    if running and poll_due:
+        poll = poll_watchlist(watchlist, ticker_symbols, move_threshold)
+        st.session_state['watchlist_poll'] = poll
+        for ticker_symbol, old_status, new_status in poll['status_changes']:
+            st.toast(f"{ticker_symbol}: {old_status} → {new_status}")
+    
+    poll = st.session_state.get('watchlist_poll')
+    if poll is None:
+        st.info("Start monitoring to poll quotes for the watchlist.")
+        return
+    
+    if poll['skipped']:
+        st.warning(f"⚠️ Quote batch failed at {poll['polled_at']:%H:%M:%S}, skipped this poll.")
+    
+    st.caption(
+        f"Last poll {poll['polled_at']:%H:%M:%S} - {poll['quoted']} quotes, "
+        f"{len(poll['chains_refreshed'])} chains refreshed, {len(poll['changed'])} symbols changed"
+        + (f", {poll['deferred']} chain refreshes deferred" if poll['deferred'] else "")
+    )
+    
+    rows = []
+    for ticker_symbol in ticker_symbols:
+        entry = watchlist.get(ticker_symbol, {})
+        result = entry.get('result')
+        issue = entry.get('error') or entry.get('quote_error') or ""
+        if result is None:
+            rows.append({"Symbol": ticker_symbol, "Status": "⏳ PENDING", "Issue": issue})
+            continue
+        recommendation, _, icon = get_recommendation_status(result)
+        rows.append({
+            "Symbol": ticker_symbol,
+            # A result that failed to update since it was computed is no longer live
+            "Status": f"{icon} {recommendation}" + (" (stale)" if issue else ""),
+            "Issue": issue,
+            "Price": f"${result['underlying_price']:.2f}",
+            "Expected Move": f"{result['expected_move']:.2f}%" if result['expected_move'] else "N/A",
+            "Avg Volume": f"{result['avg_volume']:,.0f}",
+            "IV30/RV30": f"{result['iv30_rv30']:.3f}",
+            "TS Slope": f"{result['ts_slope_0_45']:.6f}",
+            "Chain Age": f"{(datetime.now() - entry['chain_time']).total_seconds() // 60:.0f}m",
+            "Updated": "🔄" if ticker_symbol in poll['changed'] else "",
+            "Last Change": f"{entry['changed_at']:%H:%M:%S}"
+        })
+    
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    
+    ready = [s for s in ticker_symbols if 'result' in watchlist.get(s, {})]
+    if not ready:
+        return
+    
+    selected = st.selectbox("Chart Symbol", ready, key="watchlist_chart_symbol")
+    entry = watchlist[selected]
+    
+    # Rebuild figures only when the symbol's metrics changed since they were drawn
+    if entry.get('charts_version') != entry['version']:
+        entry['iv_chart'] = create_iv_chart(entry['result']['dtes'], entry['result']['ivs'])
+        entry['price_chart'] = create_price_chart(entry['price_history'])
+        entry['charts_version'] = entry['version']
+    
+    chart_col1, chart_col2 = st.columns(2)
+    
+    with chart_col1:
+        st.plotly_chart(entry['iv_chart'], use_container_width=True, key=f"watchlist_iv_{selected}")
+    
+    with chart_col2:
+        st.plotly_chart(entry['price_chart'], use_container_width=True, key=f"watchlist_price_{selected}")
+
+
+def watchlist_mode():
+    """Watchlist monitor: poll quotes on an interval and update symbols incrementally"""
+    col1, col2, col3 = st.columns([3, 1, 1])
+    
+    with col1:
+        watchlist_input = st.text_area(
+            "Watchlist Symbols:",
+            placeholder="e.g., AAPL, TSLA, MSFT",
+            help=f"Comma or whitespace separated, up to {WATCHLIST_MAX_SYMBOLS} symbols"
+        )
+    
+    with col2:
+        poll_interval = st.number_input(
+            "Poll Interval (s)",
+            min_value=15,
+            max_value=600,
+            value=60,
+            step=15
+        )
+        move_threshold = st.number_input(
+            "Chain Refresh Move (%)",
+            min_value=0.1,
+            max_value=10.0,
+            value=1.0,
+            step=0.1,
+            help="Re-fetch a symbol's options chain only after its price moves this far"
+        )
+    
+    with col3:
+        running = st.toggle("▶️ Monitor", value=False)
+    
+    ticker_symbols = list(dict.fromkeys(
+        s.strip().upper() for s in watchlist_input.replace(",", " ").split() if s.strip()
+    ))
+    if not ticker_symbols:
+        return
+    if len(ticker_symbols) > WATCHLIST_MAX_SYMBOLS:
+        st.warning(f"⚠️ Watching the first {WATCHLIST_MAX_SYMBOLS} of {len(ticker_symbols)} symbols.")
+        ticker_symbols = ticker_symbols[:WATCHLIST_MAX_SYMBOLS]
+    
+    # Only the fragment reruns on each poll, not the whole page
+    monitor = st.fragment(render_watchlist_monitor, run_every=poll_interval if running else None)
+    monitor(ticker_symbols, move_threshold / 100.0, running, int(poll_interval))
+
+
 def main():
     st.set_page_config(
         page_title="Earnings Position Checker",
@@ -555,6 +989,11 @@ def main():
         with col3:
             st.text_input("IEX Cloud API Key", type="password", help="Optional")
     
+    mode = st.radio("Mode", ["Single Analysis", "Watchlist Monitor"], horizontal=True)
+    if mode == "Watchlist Monitor":
+        watchlist_mode()
+        return
+    
     # Input section
     col1, col2 = st.columns([2, 1])
     
@@ -568,9 +1007,33 @@ def main():
     with col2:
         analyze_button = st.button("🔍 Analyze", type="primary")
     
+    # Simulation settings
+    with st.expander("🎲 Monte Carlo Simulation Settings"):
+        sim_col1, sim_col2 = st.columns(2)
+        with sim_col1:
+            sim_paths = st.select_slider(
+                "Simulated Paths",
+                options=[50_000, 100_000, 200_000, 500_000, 1_000_000],
+                value=DEFAULT_PATHS,
+                help="Paths are generated in chunks, so memory use stays flat as this grows"
+            )
+        with sim_col2:
+            sim_workers = st.number_input(
+                "Worker Processes",
+                min_value=1,
+                max_value=os.cpu_count() or 1,
+                value=1,
+                help="Spread simulation chunks across CPU cores"
+            )
+    
+    # Keep the analyzed ticker across reruns so changing the simulation settings re-simulates it
     if analyze_button and ticker_input:
-        with st.spinner(f"Analyzing {ticker_input}..."):
-            result = compute_recommendation(ticker_input)
+        st.session_state['analyzed_ticker'] = ticker_input
+    analyzed_ticker = st.session_state.get('analyzed_ticker')
+    
+    if analyzed_ticker:
+        with st.spinner(f"Analyzing {analyzed_ticker}..."):
+            result = compute_recommendation(analyzed_ticker)
         
         if "error" in result:
             st.error(f"❌ {result['error']}")
@@ -620,19 +1083,7 @@ def main():
         avg_volume_pass = result['avg_volume_pass']
         iv30_rv30_pass = result['iv30_rv30_pass']
         ts_slope_pass = result['ts_slope_pass']
-        
-        if avg_volume_pass and iv30_rv30_pass and ts_slope_pass:
-            recommendation = "RECOMMENDED"
-            color = "success"
-            icon = "✅"
-        elif ts_slope_pass and ((avg_volume_pass and not iv30_rv30_pass) or (iv30_rv30_pass and not avg_volume_pass)):
-            recommendation = "CONSIDER"
-            color = "warning"
-            icon = "⚠️"
-        else:
-            recommendation = "AVOID"
-            color = "error"
-            icon = "❌"
+        recommendation, color, icon = get_recommendation_status(result)
         
         # Display recommendation
         if color == "success":
@@ -690,6 +1141,63 @@ def main():
             with detail_col2:
                 st.metric("IV30", f"{result['ivs'][0] if result['ivs'] else 'N/A':.3f}")
                 st.metric("Days to First Expiration", f"{result['dtes'][0] if result['dtes'] else 'N/A'}")
+        
+        # Monte Carlo P&L simulation
+        st.subheader("🎲 Calendar Trade Simulation")
+        
+        if result['options_source'] != "Real Options Data":
+            st.info("ℹ️ Simulation skipped - it needs real options data, and this term structure is estimated.")
+            return
+        
+        with st.spinner(f"Simulating {sim_paths:,} paths..."):
+            sim = run_calendar_simulation(
+                result['ticker'],
+                result['underlying_price'],
+                tuple(result['dtes']),
+                tuple(result['ivs']),
+                result['rv30'],
+                result['expected_move'],
+                sim_paths,
+                int(sim_workers)
+            )
+        
+        if "error" in sim:
+            st.warning(f"⚠️ {sim['error']}")
+            return
+        
+        st.caption(
+            f"Short {sim['front_dte']}d / long {sim['back_dte']}d ATM call calendar, "
+            f"closed the session after earnings. Gaps: {sim['gap_source']}."
+        )
+        
+        sim_col1, sim_col2, sim_col3, sim_col4 = st.columns(4)
+        
+        with sim_col1:
+            st.metric("Probability of Profit", f"{sim['prob_profit']:.1%}")
+        
+        with sim_col2:
+            st.metric("Median P&L", f"{sim['percentiles_pct'][50]:.1f}%")
+        
+        with sim_col3:
+            st.metric("Mean P&L", f"{sim['mean_pnl_pct']:.1f}%")
+        
+        with sim_col4:
+            st.metric("Debit per Share", f"${sim['debit']:.2f}")
+        
+        sim_chart_col, sim_table_col = st.columns([2, 1])
+        
+        with sim_chart_col:
+            pnl_chart = create_pnl_histogram(sim['pnl_pct_sample'])
+            st.plotly_chart(pnl_chart, use_container_width=True)
+        
+        with sim_table_col:
+            percentile_df = pd.DataFrame({
+                "Percentile": [f"P{p}" for p in PERCENTILES],
+                "P&L ($/share)": [f"{sim['percentiles'][p]:.2f}" for p in PERCENTILES],
+                "P&L (% of Debit)": [f"{sim['percentiles_pct'][p]:.1f}%" for p in PERCENTILES]
+            })
+            st.dataframe(percentile_df, use_container_width=True, hide_index=True)
+            st.metric("Post-Earnings IV", f"{sim['post_earnings_iv']:.3f}")
 
 
 if __name__ == "__main__":
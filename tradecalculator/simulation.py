@@ -0,0 +1,208 @@
+"""
+Monte Carlo P&L simulation for the earnings calendar trade.
+
+The trade modelled here is the one the calculator screens for: sell the
+front-month ATM call (the expiry straddling earnings) and buy a back-month
+call at the same strike, then close both legs the session after earnings.
+
+Each path draws an earnings gap (bootstrapped from historical earnings
+reactions when available, otherwise a fat-tailed draw scaled to the
+straddle-implied expected move) and a post-earnings IV level, and reprices
+both legs with Black-Scholes. Paths are generated in fixed-size chunks so
+memory stays bounded regardless of the path count, and chunks can
+optionally be fanned out across processes.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.special import ndtr
+
+
+DEFAULT_PATHS = 200_000
+DEFAULT_CHUNK_SIZE = 50_000
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Minimum spacing (days) between the short and long legs of the calendar
+MIN_CALENDAR_SPACING = 21
+# Lognormal dispersion of the post-earnings IV level around the ex-event IV
+IV_CRUSH_DISPERSION = 0.10
+# Student-t degrees of freedom for gaps when no earnings history is available
+GAP_T_DOF = 4
+# ATM straddle ~= sqrt(2/pi) * sigma * S, so sigma ~= straddle / 0.798
+STRADDLE_TO_STDEV = np.sqrt(np.pi / 2.0)
+
+
+def bs_call_price(spot, strike, t, iv, rate=0.0):
+    """Vectorized Black-Scholes call price (t in years)"""
+    spot = np.asarray(spot, dtype=np.float64)
+    t = np.maximum(np.asarray(t, dtype=np.float64), 1e-8)
+    iv = np.maximum(np.asarray(iv, dtype=np.float64), 1e-6)
+
+    vol_sqrt_t = iv * np.sqrt(t)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * iv**2) * t) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    return spot * ndtr(d1) - strike * np.exp(-rate * t) * ndtr(d2)
+
+
+def select_calendar_legs(dtes: Sequence[int], ivs: Sequence[float]) -> Tuple[int, float, int, float]:
+    """Pick the front (short) and back (long) expirations from the term structure"""
+    dtes = np.asarray(dtes, dtype=np.float64)
+    ivs = np.asarray(ivs, dtype=np.float64)
+    sort_idx = dtes.argsort()
+    dtes = dtes[sort_idx]
+    ivs = ivs[sort_idx]
+
+    if len(dtes) < 2:
+        raise ValueError("At least two expirations are required for a calendar spread.")
+
+    front_dte, front_iv = dtes[0], ivs[0]
+    back_idx = np.searchsorted(dtes, front_dte + MIN_CALENDAR_SPACING)
+    back_idx = min(max(back_idx, 1), len(dtes) - 1)
+    return int(front_dte), float(front_iv), int(dtes[back_idx]), float(ivs[back_idx])
+
+
+def ex_event_iv(front_dte: int, front_iv: float, back_dte: int, back_iv: float, fallback_iv: float) -> float:
+    """
+    Strip the earnings event out of the term structure.
+
+    Total variance of each expiry is base_var * T + event_var, so the base
+    (post-earnings) IV follows from the forward variance between the legs.
+    """
+    t1 = front_dte / 365.0
+    t2 = back_dte / 365.0
+    if t2 <= t1:
+        return fallback_iv
+
+    forward_var = (back_iv**2 * t2 - front_iv**2 * t1) / (t2 - t1)
+    if forward_var <= 0:
+        return fallback_iv
+    return float(np.sqrt(forward_var))
+
+
+def _simulate_chunk(n_paths: int, seed, params: Dict[str, Any]) -> np.ndarray:
+    """Simulate one chunk of paths and return the P&L per share of each path"""
+    rng = np.random.default_rng(seed)
+    spot = params['spot']
+
+    if params['gaps'] is not None:
+        gaps = rng.choice(params['gaps'], size=n_paths, replace=True)
+    else:
+        dof = GAP_T_DOF
+        # Scale the t draw to unit variance before applying the move stdev
+        gaps = rng.standard_t(dof, size=n_paths) * np.sqrt((dof - 2) / dof) * params['gap_stdev']
+
+    # Ordinary diffusion for the sessions the gap draw does not already cover
+    diffusion = rng.standard_normal(n_paths) * params['diffusion_stdev']
+    exit_spot = spot * np.exp(np.log1p(np.maximum(gaps, -0.99)) + diffusion)
+
+    crush = np.exp(rng.standard_normal(n_paths) * IV_CRUSH_DISPERSION - 0.5 * IV_CRUSH_DISPERSION**2)
+    exit_iv = params['base_iv'] * crush
+
+    front_exit = bs_call_price(exit_spot, spot, params['front_t_exit'], exit_iv)
+    back_exit = bs_call_price(exit_spot, spot, params['back_t_exit'], exit_iv)
+    return (back_exit - front_exit) - params['debit']
+
+
+def simulate_calendar_pnl(
+    underlying_price: float,
+    dtes: Sequence[int],
+    ivs: Sequence[float],
+    rv30: float,
+    expected_move: Optional[float] = None,
+    historical_gaps: Optional[Sequence[float]] = None,
+    n_paths: int = DEFAULT_PATHS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    hold_days: int = 1,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Simulate the P&L distribution of an ATM call calendar held through earnings.
+
+    `expected_move` is in percent, as returned by compute_recommendation.
+    `historical_gaps` are fractional earnings-day moves (e.g. 0.05 for +5%);
+    when fewer than 4 are given the gap is drawn from a Student-t scaled to
+    the expected move instead. Set `workers` > 1 to spread chunks across
+    processes.
+    """
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive.")
+
+    front_dte, front_iv, back_dte, back_iv = select_calendar_legs(dtes, ivs)
+    base_iv = ex_event_iv(front_dte, front_iv, back_dte, back_iv, fallback_iv=rv30)
+
+    front_entry = float(bs_call_price(underlying_price, underlying_price, front_dte / 365.0, front_iv))
+    back_entry = float(bs_call_price(underlying_price, underlying_price, back_dte / 365.0, back_iv))
+    debit = back_entry - front_entry
+    if debit <= 0:
+        raise ValueError("Calendar spread has no positive debit with this term structure.")
+
+    gaps = None
+    gap_source = "Expected move (Student-t)"
+    if historical_gaps is not None and len(historical_gaps) >= 4:
+        gaps = np.asarray(historical_gaps, dtype=np.float64)
+        gap_source = f"Historical earnings gaps ({len(gaps)})"
+
+    if expected_move:
+        gap_stdev = expected_move / 100.0 * STRADDLE_TO_STDEV
+    else:
+        # Event variance implied by the front-month premium over the base IV
+        event_var = max(front_iv**2 - base_iv**2, 0.0) * front_dte / 365.0
+        gap_stdev = np.sqrt(event_var) if event_var > 0 else rv30 / np.sqrt(252)
+
+    # Historical gaps are close-to-close reaction-day returns, so they already
+    # include that session's ordinary movement
+    diffusion_days = hold_days - 1 if gaps is not None else hold_days
+
+    params = {
+        'spot': float(underlying_price),
+        'gaps': gaps,
+        'gap_stdev': float(gap_stdev),
+        'diffusion_stdev': float(rv30) * np.sqrt(diffusion_days / 252.0),
+        'base_iv': base_iv,
+        'front_t_exit': max(front_dte - hold_days, 0) / 365.0,
+        'back_t_exit': max(back_dte - hold_days, 0) / 365.0,
+        'debit': debit,
+    }
+
+    chunk_size = max(1, min(chunk_size, n_paths))
+    sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        sizes.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    pnl = np.empty(n_paths, dtype=np.float64)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+    workers = min(workers, len(sizes))
+    if workers > 1:
+        # Spawn rather than fork: forking the multithreaded Streamlit server can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = executor.map(_simulate_chunk, sizes, seeds, [params] * len(sizes))
+            for i, chunk in enumerate(results):
+                pnl[offsets[i]:offsets[i + 1]] = chunk
+    else:
+        for i, (size, chunk_seed) in enumerate(zip(sizes, seeds)):
+            pnl[offsets[i]:offsets[i + 1]] = _simulate_chunk(size, chunk_seed, params)
+
+    pnl_pct = pnl / debit * 100.0
+    return {
+        'n_paths': n_paths,
+        'front_dte': front_dte,
+        'back_dte': back_dte,
+        'front_iv': front_iv,
+        'back_iv': back_iv,
+        'post_earnings_iv': base_iv,
+        'debit': debit,
+        'gap_source': gap_source,
+        'prob_profit': float((pnl > 0).mean()),
+        'mean_pnl': float(pnl.mean()),
+        'mean_pnl_pct': float(pnl_pct.mean()),
+        'percentiles': {p: float(v) for p, v in zip(PERCENTILES, np.percentile(pnl, PERCENTILES))},
+        'percentiles_pct': {p: float(v) for p, v in zip(PERCENTILES, np.percentile(pnl_pct, PERCENTILES))},
+        'pnl_pct_sample': pnl_pct[:min(n_paths, 20_000)],
+    }